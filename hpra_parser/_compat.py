@@ -0,0 +1,9 @@
+"""Compatibility shims for the supported Python versions."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict
+
+# dataclass(slots=True) needs Python 3.10+; on 3.9 instances keep a __dict__.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
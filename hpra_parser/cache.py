@@ -0,0 +1,89 @@
+"""Sidecar cache of previous conversions so unchanged inputs can be skipped."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from ._compat import DATACLASS_SLOTS
+from .integrity import calculate_sha256
+
+CACHE_FILENAME = ".hpra_cache.json"
+
+# Bump whenever the converter writes different bytes for the same input, so
+# outputs recorded by an older version are regenerated rather than reused.
+# Entries written before the version was recorded are treated as version 1.
+OUTPUT_FORMAT_VERSION = 3
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class CacheEntry:
+    """Record of the conversion that produced an output file."""
+    input_sha256: str
+    output_sha256: str
+    flatten: bool
+    records_processed: int
+    format_version: int = 1
+
+    def is_current(self, input_sha256: str, output_path: Path, flatten: bool) -> bool:
+        """Check whether the output on disk is still the result for this input.
+
+        Args:
+            input_sha256: SHA-256 hash of the input file as it is now
+            output_path: Path to the previously written JSON file
+            flatten: Whether flattened output is requested
+
+        Returns:
+            True if the input, settings and output format are unchanged and
+            the output file still has the recorded hash, False otherwise
+        """
+        if self.format_version != OUTPUT_FORMAT_VERSION:
+            return False
+        if self.input_sha256 != input_sha256 or self.flatten != flatten:
+            return False
+        try:
+            return calculate_sha256(output_path) == self.output_sha256
+        except OSError:
+            # Output was removed or is unreadable
+            return False
+
+
+class ConversionCache:
+    """Cache entries for one output directory, keyed by output filename."""
+
+    def __init__(self, directory: Path) -> None:
+        self.path = directory / CACHE_FILENAME
+        self.entries: Dict[str, CacheEntry] = {}
+
+    @classmethod
+    def load(cls, directory: Path) -> ConversionCache:
+        """Load the cache stored in a directory.
+
+        A missing or unreadable cache file yields an empty cache; it is
+        rebuilt on the next save.
+        """
+        cache = cls(directory)
+        try:
+            raw = json.loads(cache.path.read_text(encoding="utf-8"))
+            cache.entries = {name: CacheEntry(**fields) for name, fields in raw.items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            cache.entries = {}
+        return cache
+
+    def get(self, output_path: Path) -> Optional[CacheEntry]:
+        """Return the entry recorded for an output file, if any."""
+        return self.entries.get(output_path.name)
+
+    def put(self, output_path: Path, entry: CacheEntry) -> None:
+        """Record the conversion that produced an output file."""
+        self.entries[output_path.name] = entry
+
+    def save(self) -> None:
+        """Write the cache file atomically via a temporary file and rename."""
+        payload = {name: asdict(entry) for name, entry in self.entries.items()}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
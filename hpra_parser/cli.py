@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import multiprocessing
+import os
 import sys
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import List
-from xml.etree import ElementTree as ET
+from typing import List, NamedTuple, Optional
 
+from .cache import OUTPUT_FORMAT_VERSION, CacheEntry, ConversionCache
 from .converter import convert_xml_to_json
 from .integrity import FileChecksum, write_checksums_csv
 from .quality_report import (
@@ -16,7 +19,7 @@ from .quality_report import (
     ProcessingResult,
     generate_excel_report,
     generate_text_report,
-    OPENPYXL_AVAILABLE,
+    EXCEL_AVAILABLE,
 )
 
 
@@ -72,6 +75,28 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Disable generation of SHA-256 integrity checksums.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-convert every file even if its input and output are unchanged since the last run.",
+    )
+    parser.add_argument(
+        "--share-subtrees",
+        action="store_true",
+        help="Share identical repeated XML subtrees while converting to reduce memory use.",
+    )
+    parser.add_argument(
+        "--fsync",
+        action="store_true",
+        help="Flush each JSON output to disk before continuing (slower; for audit builds).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of files to convert in parallel (default: number of CPUs).",
+    )
     parser.add_argument(
         "files",
         nargs="*",
@@ -93,7 +118,15 @@ def resolve_targets(input_dir: Path, selected_files: List[Path]) -> List[Path]:
                 print(f"Skipping {candidate}: not an XML file.")
         return targets
 
-    return sorted(input_dir.glob("*.xml"))
+    # scandir reuses the directory listing's file type, avoiding a stat per entry
+    with os.scandir(input_dir) as entries:
+        targets = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(".xml") and entry.is_file()
+        ]
+    targets.sort()
+    return targets
 
 
 def generate_quality_report(metrics: BatchMetrics, output_dir: Path, report_format: str) -> None:
@@ -101,7 +134,7 @@ def generate_quality_report(metrics: BatchMetrics, output_dir: Path, report_form
     timestamp = metrics.start_time.strftime("%Y%m%d_%H%M%S")
     
     if report_format in ("excel", "both"):
-        if OPENPYXL_AVAILABLE:
+        if EXCEL_AVAILABLE:
             excel_path = output_dir / f"quality_report_{timestamp}.xlsx"
             try:
                 generate_excel_report(metrics, excel_path)
@@ -124,6 +157,135 @@ def generate_quality_report(metrics: BatchMetrics, output_dir: Path, report_form
         print(f"Quality report (Text): {text_path}")
 
 
+class _ConversionTask(NamedTuple):
+    index: int
+    xml_file: Path
+    output_file: Path
+    flatten: bool
+    calculate_checksums: bool
+    use_cache: bool
+    cache_entry: Optional[CacheEntry]
+    share_subtrees: bool
+    fsync: bool
+
+
+class _ConversionOutcome(NamedTuple):
+    index: int
+    result: ProcessingResult
+    checksums: List[FileChecksum]
+    cache_entry: Optional[CacheEntry] = None
+    cached: bool = False
+
+
+def _process_one(task: _ConversionTask) -> _ConversionOutcome:
+    """Convert a single XML file and describe the outcome.
+
+    Kept at module level so it can be pickled into worker processes.
+    """
+    index, xml_file, output_file, flatten, calculate_checksums, use_cache, cache_entry, share_subtrees, fsync = task
+    timestamp = datetime.now()
+    checksums: List[FileChecksum] = []
+    new_cache_entry = None
+    cached = False
+
+    # Check if file should be skipped
+    if not xml_file.exists():
+        result = ProcessingResult(
+            filename=xml_file.name,
+            status="skipped",
+            timestamp=timestamp,
+            error_message="File does not exist"
+        )
+        return _ConversionOutcome(index, result, checksums)
+
+    # Process the file
+    try:
+        conversion_result = convert_xml_to_json(
+            xml_file,
+            output_file,
+            flatten=flatten,
+            # The cache needs both hashes even when checksums are not reported
+            calculate_checksums=calculate_checksums or use_cache,
+            cache_entry=cache_entry,
+            share_subtrees=share_subtrees,
+            fsync=fsync
+        )
+
+        if conversion_result.success:
+            cached = conversion_result.cached
+            if use_cache:
+                new_cache_entry = CacheEntry(
+                    input_sha256=conversion_result.input_sha256,
+                    output_sha256=conversion_result.output_sha256,
+                    flatten=flatten,
+                    records_processed=conversion_result.records_processed,
+                    format_version=OUTPUT_FORMAT_VERSION
+                )
+
+            # Store checksums if enabled
+            if calculate_checksums and conversion_result.input_sha256:
+                checksums.append(FileChecksum(
+                    filename=xml_file.name,
+                    file_type="input",
+                    sha256_hash=conversion_result.input_sha256,
+                    file_size=xml_file.stat().st_size,
+                    timestamp=timestamp,
+                    relative_path=xml_file.name
+                ))
+
+                if conversion_result.output_sha256:
+                    checksums.append(FileChecksum(
+                        filename=output_file.name,
+                        file_type="output",
+                        sha256_hash=conversion_result.output_sha256,
+                        file_size=output_file.stat().st_size,
+                        timestamp=timestamp,
+                        relative_path=output_file.name
+                    ))
+
+            if conversion_result.warning_message:
+                status = "warning"
+            else:
+                status = "success"
+
+            result = ProcessingResult(
+                filename=xml_file.name,
+                status=status,
+                timestamp=timestamp,
+                records_processed=conversion_result.records_processed,
+                warning_message=conversion_result.warning_message
+            )
+        else:
+            result = ProcessingResult(
+                filename=xml_file.name,
+                status="failure",
+                timestamp=timestamp,
+                error_message=conversion_result.error_message
+            )
+
+    except Exception as exc:
+        result = ProcessingResult(
+            filename=xml_file.name,
+            status="failure",
+            timestamp=timestamp,
+            error_message=f"Unexpected error: {str(exc)}"
+        )
+
+    return _ConversionOutcome(index, result, checksums, new_cache_entry, cached)
+
+
+def _print_outcome(outcome: _ConversionOutcome, output_file: Path, flatten: bool) -> None:
+    result = outcome.result
+    if result.status == "skipped":
+        print(f"Skipping {result.filename}: {result.error_message}")
+    elif result.status == "failure":
+        print(f"Failed to process {result.filename}: {result.error_message}")
+    elif outcome.cached:
+        print(f"Unchanged {result.filename} -> {output_file.name} (cached)")
+    else:
+        print(f"Converted {result.filename} -> {output_file.name} (flatten={flatten})")
+
+
 def run(argv: List[str] | None = None) -> int:
     args = parse_args(argv)
     input_dir: Path = (args.input or default_input_dir()).resolve()
@@ -142,87 +304,50 @@ def run(argv: List[str] | None = None) -> int:
     metrics = BatchMetrics()
     checksums: List[FileChecksum] = []
     calculate_checksums = not args.no_checksums
-    
-    for xml_file in targets:
+    cache = None if args.no_cache else ConversionCache.load(output_dir)
+
+    tasks = []
+    for index, xml_file in enumerate(targets):
         output_file = output_dir / f"{xml_file.stem}.json"
-        print(f"Processing {xml_file.name} -> {output_file.name} (flatten={args.flatten})")
-        
-        timestamp = datetime.now()
-        
-        # Check if file should be skipped
-        if not xml_file.exists():
-            result = ProcessingResult(
-                filename=xml_file.name,
-                status="skipped",
-                timestamp=timestamp,
-                error_message="File does not exist"
-            )
-            metrics.add_result(result)
-            continue
-        
-        # Process the file
-        try:
-            conversion_result = convert_xml_to_json(
-                xml_file, 
-                output_file, 
-                flatten=args.flatten,
-                calculate_checksums=calculate_checksums
-            )
-            
-            if conversion_result.success:
-                # Store checksums if enabled
-                if calculate_checksums and conversion_result.input_sha256:
-                    checksums.append(FileChecksum(
-                        filename=xml_file.name,
-                        file_type="input",
-                        sha256_hash=conversion_result.input_sha256,
-                        file_size=xml_file.stat().st_size,
-                        timestamp=timestamp,
-                        relative_path=xml_file.name
-                    ))
-                    
-                    if conversion_result.output_sha256:
-                        checksums.append(FileChecksum(
-                            filename=output_file.name,
-                            file_type="output",
-                            sha256_hash=conversion_result.output_sha256,
-                            file_size=output_file.stat().st_size,
-                            timestamp=timestamp,
-                            relative_path=output_file.name
-                        ))
-                
-                if conversion_result.warning_message:
-                    status = "warning"
-                else:
-                    status = "success"
-                
-                result = ProcessingResult(
-                    filename=xml_file.name,
-                    status=status,
-                    timestamp=timestamp,
-                    records_processed=conversion_result.records_processed,
-                    warning_message=conversion_result.warning_message
-                )
-            else:
-                result = ProcessingResult(
-                    filename=xml_file.name,
-                    status="failure",
-                    timestamp=timestamp,
-                    error_message=conversion_result.error_message
-                )
-                print(f"Failed to process {xml_file.name}: {conversion_result.error_message}")
-            
-            metrics.add_result(result)
-            
-        except Exception as exc:
-            result = ProcessingResult(
-                filename=xml_file.name,
-                status="failure",
-                timestamp=timestamp,
-                error_message=f"Unexpected error: {str(exc)}"
-            )
-            metrics.add_result(result)
-            print(f"Unexpected error while processing {xml_file.name}: {exc}.")
+        tasks.append(_ConversionTask(
+            index=index,
+            xml_file=xml_file,
+            output_file=output_file,
+            flatten=args.flatten,
+            calculate_checksums=calculate_checksums,
+            use_cache=cache is not None,
+            cache_entry=cache.get(output_file) if cache is not None else None,
+            share_subtrees=args.share_subtrees,
+            fsync=args.fsync
+        ))
+    jobs = min(max(1, args.jobs or os.cpu_count() or 1), len(tasks))
+    print(f"Processing {len(tasks)} file(s) with {jobs} worker(s) (flatten={args.flatten})")
+
+    outcomes: List[_ConversionOutcome] = []
+    if jobs > 1:
+        # Files are independent, so convert them in worker processes and
+        # collect results as they finish.
+        chunksize = max(1, len(tasks) // (4 * jobs))
+        with multiprocessing.Pool(processes=jobs) as pool:
+            for outcome in pool.imap_unordered(_process_one, tasks, chunksize=chunksize):
+                _print_outcome(outcome, tasks[outcome.index].output_file, args.flatten)
+                outcomes.append(outcome)
+    else:
+        for task in tasks:
+            outcome = _process_one(task)
+            _print_outcome(outcome, task.output_file, args.flatten)
+            outcomes.append(outcome)
+
+    # Record results in input order so reports and checksums are deterministic.
+    outcomes.sort(key=attrgetter("index"))
+    for outcome in outcomes:
+        metrics.add_result(outcome.result)
+        checksums.extend(outcome.checksums)
+        if cache is not None and outcome.cache_entry is not None:
+            cache.put(tasks[outcome.index].output_file, outcome.cache_entry)
+
+    if cache is not None:
+        cache.save()
 
     # Finalize metrics
     metrics.finalize()
@@ -250,6 +375,8 @@ def run(argv: List[str] | None = None) -> int:
 
 
 def main() -> None:
+    # Required for worker processes in the frozen Windows executable.
+    multiprocessing.freeze_support()
     raise SystemExit(run())
 
 
@@ -2,16 +2,59 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
+import itertools
 import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import methodcaller
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from xml.etree import ElementTree as ET
 
+from ._compat import DATACLASS_SLOTS
+from .cache import CacheEntry
 from .integrity import calculate_sha256
 
+try:
+    from lxml import etree
+    # Only lxml 5.0+ understands resolve_entities="internal"; older releases
+    # treat the string as true and expand external entities (XXE), so they
+    # are ignored in favour of the standard library parser.
+    LXML_AVAILABLE = etree.LXML_VERSION >= (5, 0)
+except ImportError:
+    LXML_AVAILABLE = False
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_NO_RECORDS_WARNING = "No products found in XML file"
+
+# Buffer size for streamed JSON output
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Shared read-only stand-in for an element with no converted children
+_NO_CHILDREN: Dict[str, List[Any]] = {}
+
+# Smallest subtree, counted in nodes, that parse_xml will share when asked to;
+# below this the lookup costs more than the duplicate it saves.
+_SHARE_MIN_WEIGHT = 6
+
+if LXML_AVAILABLE:
+    _PARSE_ERRORS = (ET.ParseError, etree.XMLSyntaxError)
+    _lxml_child_elements = methodcaller("iterchildren", etree.Element)
+else:
+    _PARSE_ERRORS = (ET.ParseError,)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ConversionResult:
     """Result of converting an XML file to JSON."""
     success: bool
@@ -20,40 +63,33 @@ class ConversionResult:
     error_message: Optional[str] = None
     input_sha256: Optional[str] = None
     output_sha256: Optional[str] = None
+    cached: bool = False
 
 
-def strip_namespace(tag: str) -> str:
-    """Return the local part of an XML tag (drop the namespace URI)."""
-    if tag.startswith("{"):
-        return tag.split("}", 1)[1]
-    return tag
+# Qualified tag/attribute name -> interned local name. XML vocabularies are
+# small, so this stays tiny while every dict key shares one string object.
+_LOCAL_NAMES: Dict[str, str] = {}
 
 
-def etree_to_dict(node: ET.Element) -> Any:
-    """Recursively convert an ElementTree node into nested dictionaries/lists."""
-    tag = strip_namespace(node.tag)
-    children = list(node)
-    text = (node.text or "").strip()
+def strip_namespace(tag: str) -> str:
+    """Return the local part of an XML tag (drop the namespace URI)."""
+    local = _LOCAL_NAMES.get(tag)
+    if local is None:
+        local = sys.intern(tag.rpartition("}")[2])
+        _LOCAL_NAMES[tag] = local
+    return local
 
-    if not children and not node.attrib:
-        return text or None
 
+def _node_value(tag: str, attrib: Any, text: Optional[str], grouped_children: Dict[str, List[Any]]) -> Any:
+    """Build the dict/list/str value for an element from its already-converted children."""
+    text = (text or "").strip()
     result: Dict[str, Any] = {}
 
-    if node.attrib:
-        result["attributes"] = {strip_namespace(key): value for key, value in node.attrib.items()}
-
-    if children:
-        grouped_children: Dict[str, List[Any]] = {}
-        for child in children:
-            key = strip_namespace(child.tag)
-            value = etree_to_dict(child)
-            if value is None:
-                continue
-            grouped_children.setdefault(key, []).append(value)
+    if attrib:
+        result["attributes"] = {strip_namespace(key): value for key, value in attrib.items()}
 
-        for key, values in grouped_children.items():
-            result[key] = values[0] if len(values) == 1 else values
+    for key, values in grouped_children.items():
+        result[key] = values[0] if len(values) == 1 else values
 
     if text:
         if result:
@@ -62,7 +98,7 @@ def etree_to_dict(node: ET.Element) -> Any:
             return text
 
     if not result:
-        return text or None
+        return None
 
     if "attributes" not in result and "value" not in result and len(result) == 1:
         sole_key, sole_value = next(iter(result.items()))
@@ -72,39 +108,158 @@ def etree_to_dict(node: ET.Element) -> Any:
     return result
 
 
-def flatten_dict(value: Any, parent_key: str = "", sep: str = ".") -> Dict[str, Any]:
-    """Flatten nested dictionaries/lists into a single dictionary."""
-    items: Dict[str, Any] = {}
+def etree_to_dict(node: ET.Element) -> Any:
+    """Convert an ElementTree node into nested dictionaries/lists.
+
+    Walks the tree with an explicit stack rather than recursion, so deeply
+    nested documents cannot exhaust the interpreter's recursion limit.
+    """
+    # lxml trees also contain comments and processing instructions; its C
+    # iterator can skip them without materializing a child list.
+    if LXML_AVAILABLE and isinstance(node, etree._Element):
+        child_elements = _lxml_child_elements
+    else:
+        child_elements = iter
+
+    if len(node) == 0 and not node.attrib:
+        text = node.text
+        return (text.strip() or None) if text else None
+
+    # Frames of (element, local tag, pending children, grouped child values)
+    stack = [(node, strip_namespace(node.tag), child_elements(node), {})]
+    while True:
+        element, tag, children, grouped_children = stack[-1]
+        for child in children:
+            if len(child) == 0 and not child.attrib:
+                # Leaf without attributes: its value is just the stripped text
+                text = (child.text or "").strip()
+                if text:
+                    # setdefault is a single lookup; defaultdict(list) measured
+                    # slower here because most sibling tags are distinct
+                    grouped_children.setdefault(strip_namespace(child.tag), []).append(text)
+                continue
+            stack.append((child, strip_namespace(child.tag), child_elements(child), {}))
+            break
+        else:
+            stack.pop()
+            value = _node_value(tag, element.attrib, element.text, grouped_children)
+            if not stack:
+                return value
+            if value is not None:
+                stack[-1][3].setdefault(tag, []).append(value)
+
+
+def _flatten_children(value: Any, parent_key: str, sep: str, items: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+    """Yield the keyed entries one level below a dict or list.
 
+    Attribute dicts are written straight into ``items`` as they are reached,
+    which keeps them in document order relative to their sibling keys.
+    """
     if isinstance(value, dict):
+        # Built once per container; child keys are then a single concatenation.
+        prefix = parent_key + sep if parent_key else ""
         for key, val in value.items():
             if key == "attributes" and isinstance(val, dict):
-                attr_prefix = f"{parent_key}{sep}attributes" if parent_key else "attributes"
+                attr_prefix = prefix + "attributes" + sep
                 for attr_key, attr_val in val.items():
-                    combined_key = f"{attr_prefix}{sep}{attr_key}" if attr_prefix else attr_key
-                    items[combined_key] = attr_val
+                    items[attr_prefix + attr_key] = attr_val
                 continue
 
-            new_key = f"{parent_key}{sep}{key}" if parent_key else key
-            items.update(flatten_dict(val, new_key, sep))
-    elif isinstance(value, list):
-        if not parent_key:
-            for index, item in enumerate(value):
-                indexed_key = f"[{index}]"
-                items.update(flatten_dict(item, indexed_key, sep))
-        elif all(not isinstance(item, (dict, list)) for item in value):
-            items[parent_key] = value
-        else:
-            for index, item in enumerate(value):
-                indexed_key = f"{parent_key}[{index}]"
-                items.update(flatten_dict(item, indexed_key, sep))
+            yield prefix + key, val
     else:
-        if parent_key:
-            items[parent_key] = value
+        prefix = parent_key + "["
+        for index, item in enumerate(value):
+            yield prefix + str(index) + "]", item
+
+
+class _SubtreeCache:
+    """Hash-consing table so identical converted subtrees share one object.
+
+    Values are offered bottom-up, so by the time a container is looked up its
+    children are already canonical and can be keyed by identity; building a
+    key only looks one level deep into containers that were not shared.
+    """
+
+    def __init__(self, min_weight: int = _SHARE_MIN_WEIGHT) -> None:
+        self._min_weight = min_weight
+        self._canonical: Dict[Any, Any] = {}
+        # id() -> weight for every canonical value. They are kept alive by
+        # _canonical, so their ids cannot be reused while the cache exists.
+        self._weights: Dict[int, int] = {}
+
+    def _describe(self, value: Any) -> Tuple[Any, int]:
+        """Return a hashable structural key for a value and its weight in nodes."""
+        if isinstance(value, str):
+            return value, 1
+        weight = self._weights.get(id(value))
+        if weight is not None:
+            return id(value), weight
+
+        weight = 1
+        parts = []
+        if isinstance(value, dict):
+            for key, item in value.items():
+                item_key, item_weight = self._describe(item)
+                parts.append((key, item_key))
+                weight += item_weight
+            return (dict, tuple(parts)), weight
+
+        for item in value:
+            item_key, item_weight = self._describe(item)
+            parts.append(item_key)
+            weight += item_weight
+        return (list, tuple(parts)), weight
+
+    def share(self, value: Any) -> Any:
+        """Return the canonical object equal to value, registering it if new."""
+        if isinstance(value, str) or id(value) in self._weights:
+            return value
+
+        key, weight = self._describe(value)
+        if weight < self._min_weight:
+            return value
+
+        canonical = self._canonical.get(key)
+        if canonical is None:
+            self._canonical[key] = value
+            self._weights[id(value)] = weight
+            return value
+        return canonical
+
+
+def flatten_dict(value: Any, parent_key: str = "", sep: str = ".") -> Dict[str, Any]:
+    """Flatten nested dictionaries/lists into a single dictionary."""
+    items: Dict[str, Any] = {}
+
+    # Depth-first walk over a stack of child iterators; descending into a
+    # container suspends its parent's iterator so key order is preserved.
+    stack: List[Iterator[Tuple[str, Any]]] = [iter(((parent_key, value),))]
+    while stack:
+        for key, val in stack[-1]:
+            if isinstance(val, dict):
+                stack.append(_flatten_children(val, key, sep, items))
+                break
+            if isinstance(val, list):
+                if key and all(not isinstance(item, (dict, list)) for item in val):
+                    items[key] = val
+                    continue
+                stack.append(_flatten_children(val, key, sep, items))
+                break
+            if key:
+                items[key] = val
+        else:
+            stack.pop()
 
     return items
 
 
+def _root_attribute_items(root_attrs: Any) -> Dict[str, Any]:
+    """Return the Products.attributes.* entries added to every flattened product."""
+    if not isinstance(root_attrs, dict):
+        return {}
+    return {f"Products.attributes.{attr_key}": attr_val for attr_key, attr_val in root_attrs.items()}
+
+
 def flatten_data(data: Dict[str, Any]) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """Flatten the nested product-focused JSON into table-friendly records."""
     products_section = data.get("Products")
@@ -113,27 +268,344 @@ def flatten_data(data: Dict[str, Any]) -> Union[List[Dict[str, Any]], Dict[str,
         if not isinstance(products_raw, list):
             products_raw = [products_raw] if products_raw is not None else []
 
+        # The root attributes are appended to every record; key them once.
+        root_items = _root_attribute_items(products_section.get("attributes"))
+
         flattened_products: List[Dict[str, Any]] = []
-        root_attrs = products_section.get("attributes")
         for product in products_raw:
             flattened = flatten_dict(product)
-            if isinstance(root_attrs, dict):
-                for attr_key, attr_val in root_attrs.items():
-                    flattened[f"Products.attributes.{attr_key}"] = attr_val
+            flattened.update(root_items)
             flattened_products.append(flattened)
         return flattened_products
 
     return flatten_dict(data)
 
 
-def parse_xml(xml_path: Path) -> Dict[str, Any]:
-    """Parse a HPRA XML file into the nested dictionary representation."""
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-    return {strip_namespace(root.tag): etree_to_dict(root)}
+def serialize_json(data: Any) -> bytes:
+    """Serialize data as 2-space indented UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+class _HashingWriter(io.RawIOBase):
+    """Binary sink that feeds everything written through it into a SHA-256 digest."""
+
+    def __init__(self, raw: BinaryIO) -> None:
+        super().__init__()
+        self._raw = raw
+        self.sha256 = hashlib.sha256()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self.sha256.update(data)
+        return self._raw.write(data)
+
 
+def _write_payload(output_path: Path, payload: bytes, fsync: bool = False) -> None:
+    """Write a complete payload straight to the file descriptor, bypassing Python buffering."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(output_path, flags, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            # os.write may write less than asked for very large payloads
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_json(data: Any, output_path: Path, calculate_checksum: bool = True, fsync: bool = False) -> Optional[str]:
+    """Write data to a file as indented UTF-8 JSON.
+
+    Args:
+        data: JSON-serializable data
+        output_path: Path to the output JSON file
+        calculate_checksum: If True, hash the bytes as they are written
+        fsync: If True, flush the file to stable storage before returning
+
+    Returns:
+        SHA-256 hex digest of the written bytes, or None if not requested
+    """
+    if ORJSON_AVAILABLE:
+        payload = serialize_json(data)
+        _write_payload(output_path, payload, fsync=fsync)
+        return hashlib.sha256(payload).hexdigest() if calculate_checksum else None
 
-def convert_xml_to_json(input_path: Path, output_path: Path, flatten: bool = False, calculate_checksums: bool = True) -> ConversionResult:
+    # Stream the encoder output to disk, hashing each buffered block on the
+    # way through, instead of materializing the whole document as a string.
+    with open(output_path, "wb") as raw:
+        sink = _HashingWriter(raw)
+        buffered = io.BufferedWriter(sink, buffer_size=_WRITE_BUFFER_SIZE)
+        with io.TextIOWrapper(buffered, encoding="utf-8", newline="\n") as stream:
+            json.dump(data, stream, indent=2, ensure_ascii=False)
+            stream.flush()
+        if fsync:
+            raw.flush()
+            os.fsync(raw.fileno())
+    return sink.sha256.hexdigest() if calculate_checksum else None
+
+
+def _iterparse(source: BinaryIO) -> Tuple[Iterator[Tuple[str, Any]], bool]:
+    """Start iterparse on source; return the events and whether lxml is used.
+
+    lxml does not apply attribute defaults declared in a document's own DTD
+    unless it is also allowed to load external DTDs, while the standard
+    library parser always applies them. lxml cannot tell whether a DOCTYPE
+    declares any, so documents with one are left to the standard library.
+    """
+    if not LXML_AVAILABLE:
+        return ET.iterparse(source, events=("start", "end")), False
+
+    # Expand internal entities like the standard library parser does,
+    # but reject external ones rather than reading local files
+    events = etree.iterparse(source, events=("start", "end"), resolve_entities="internal")
+    first = next(events)
+    if first[1].getroottree().docinfo.internalDTD is not None:
+        source.seek(0)
+        return ET.iterparse(source, events=("start", "end")), False
+    return itertools.chain((first,), events), True
+
+
+def _build_document(
+    xml_path: Path,
+    share_subtrees: bool = False,
+    on_product: Optional[Callable[[Any, Dict[str, str]], None]] = None,
+) -> Dict[str, Any]:
+    """Convert an XML file bottom-up from iterparse events (see parse_xml).
+
+    When on_product is given, each non-empty Product element directly under a
+    Products root is passed to ``on_product(value, root_attributes)`` as soon
+    as it is complete, and is left out of the returned document.
+    """
+    subtrees = _SubtreeCache() if share_subtrees else None
+    stream_products = False
+    root_attributes: Dict[str, str] = {}
+
+    # Grouped child values per open element; index 0 collects the root. Frames
+    # start as None and get a dict on the first child value, so attribute-free
+    # leaves (most of an HPRA document) never allocate one.
+    stack: List[Optional[Dict[str, List[Any]]]] = [{}]
+
+    with open(xml_path, "rb") as source:
+        events, use_lxml = _iterparse(source)
+
+        for event, elem in events:
+            if event == "start":
+                if on_product is not None and len(stack) == 1:
+                    stream_products = strip_namespace(elem.tag) == "Products"
+                    root_attributes = {strip_namespace(key): value for key, value in elem.attrib.items()}
+                stack.append(None)
+                continue
+
+            grouped_children = stack.pop()
+            tag = strip_namespace(elem.tag)
+            if grouped_children is None and not elem.attrib:
+                text = elem.text
+                value = (text.strip() or None) if text else None
+            else:
+                value = _node_value(tag, elem.attrib, elem.text, grouped_children or _NO_CHILDREN)
+                if subtrees is not None and value is not None:
+                    value = subtrees.share(value)
+            if value is not None:
+                if stream_products and len(stack) == 2 and tag == "Product":
+                    on_product(value, root_attributes)
+                else:
+                    siblings = stack[-1]
+                    if siblings is None:
+                        siblings = stack[-1] = {}
+                    siblings.setdefault(tag, []).append(value)
+
+            elem.clear()
+            if use_lxml:
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+    # The final "end" event is always the root element.
+    return {tag: value}
+
+
+def parse_xml(xml_path: Path, share_subtrees: bool = False) -> Dict[str, Any]:
+    """Parse a HPRA XML file into the nested dictionary representation.
+
+    Elements are converted bottom-up as the parser finishes them and cleared
+    straight away, so memory is bounded by the converted output rather than
+    an in-memory DOM. lxml is used when installed, otherwise the standard
+    library parser; documents with a DOCTYPE always use the standard library
+    parser so attribute defaults declared in their DTD are applied.
+
+    Args:
+        xml_path: Path to the XML file
+        share_subtrees: If True, structurally identical subtrees are returned
+            as one shared object. This saves memory on repetitive documents,
+            but the result must then be treated as read-only.
+    """
+    return _build_document(xml_path, share_subtrees=share_subtrees)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_schema(schema_path: str) -> Any:
+    """Compile an XSD schema once per process and reuse it.
+
+    Schema files are assumed not to change while the process runs; every
+    validation against the same path shares the compiled XMLSchema.
+    """
+    return etree.XMLSchema(etree.parse(schema_path, _xml_parser()))
+
+
+def _xml_parser() -> Any:
+    """Create an lxml parser that expands internal entities but rejects
+    external ones, matching the standard library parser."""
+    return etree.XMLParser(resolve_entities="internal")
+
+
+def validate_xml(xml_path: Path, schema_path: Path) -> List[str]:
+    """Validate an XML file against an XSD schema.
+    
+    Args:
+        xml_path: Path to the XML file to validate
+        schema_path: Path to the XSD schema
+    
+    Returns:
+        List of validation error messages (empty if the file is valid)
+    """
+    if not LXML_AVAILABLE:
+        raise ImportError(
+            "lxml 5.0 or newer is required for XML schema validation. "
+            'Install or upgrade it with: pip install "lxml>=5.0"'
+        )
+    
+    # Resolve so different spellings of one path share a cache entry
+    schema = _load_schema(str(Path(schema_path).resolve()))
+    document = etree.parse(str(xml_path), _xml_parser())
+    if schema.validate(document):
+        return []
+    return [f"Line {error.line}: {error.message}" for error in schema.error_log]
+
+
+def _write_nested(
+    input_path: Path,
+    output_path: Path,
+    share_subtrees: bool,
+    calculate_checksum: bool,
+    fsync: bool,
+) -> Tuple[int, Optional[str]]:
+    """Convert to nested JSON; return the product count and output hash."""
+    data = parse_xml(input_path, share_subtrees=share_subtrees)
+
+    # Count records in nested structure
+    records_count = 0
+    products_section = data.get("Products", {})
+    if isinstance(products_section, dict):
+        products = products_section.get("Product", [])
+        if isinstance(products, list):
+            records_count = len(products)
+        elif products is not None:
+            records_count = 1
+
+    # Hash the bytes as they are written rather than reading the file back
+    return records_count, write_json(data, output_path, calculate_checksum=calculate_checksum, fsync=fsync)
+
+
+def _write_flattened(
+    input_path: Path,
+    output_path: Path,
+    share_subtrees: bool,
+    calculate_checksum: bool,
+    fsync: bool,
+) -> Tuple[int, Optional[str]]:
+    """Convert to flattened JSON; return the record count and output hash.
+
+    Products are flattened and written one at a time while the file is still
+    being parsed, so only one product is held in memory. The output is
+    byte-for-byte what ``write_json(flatten_data(parse_xml(...)))`` produces.
+    """
+    sha256 = hashlib.sha256() if calculate_checksum else None
+    records_count = 0
+    products_seen = 0
+    root_items: Optional[Dict[str, Any]] = None
+    # A lone Product whose value collapsed to a list is expanded into one
+    # record per item by flatten_data, but a list-valued product among
+    # siblings is one record; the first is held back until that is known.
+    held_product: Optional[List[Any]] = None
+
+    # Stream into a sibling file so a parse error part-way through leaves any
+    # previous output untouched instead of truncated.
+    partial_path = output_path.with_name(output_path.name + ".partial")
+    with open(partial_path, "wb", buffering=_WRITE_BUFFER_SIZE) as stream:
+        if sha256 is None:
+            emit = stream.write
+        else:
+            def emit(chunk: bytes) -> None:
+                sha256.update(chunk)
+                stream.write(chunk)
+
+        def write_record(product: Any) -> None:
+            nonlocal records_count
+            flattened = flatten_dict(product)
+            flattened.update(root_items)
+            # Re-indent the record one level to sit inside the top-level array;
+            # JSON strings never contain raw newlines, so this is safe.
+            record = serialize_json(flattened).replace(b"\n", b"\n  ")
+            emit((b",\n  " if records_count else b"[\n  ") + record)
+            records_count += 1
+
+        def write_product(product: Any, root_attributes: Dict[str, str]) -> None:
+            nonlocal products_seen, root_items, held_product
+            if root_items is None:
+                root_items = _root_attribute_items(root_attributes)
+            products_seen += 1
+            if products_seen == 1 and isinstance(product, list):
+                held_product = product
+                return
+            if held_product is not None:
+                write_record(held_product)
+                held_product = None
+            write_record(product)
+
+        try:
+            document = _build_document(input_path, share_subtrees=share_subtrees, on_product=write_product)
+
+            if held_product is not None:
+                # It was the only product: one record per item, as in flatten_data
+                for item in held_product:
+                    write_record(item)
+
+            if records_count:
+                emit(b"\n]")
+            else:
+                # Not a Products/Product document: flatten whatever was parsed
+                data = flatten_data(document)
+                records_count = len(data) if isinstance(data, list) else 1
+                emit(serialize_json(data))
+
+            if fsync:
+                stream.flush()
+                os.fsync(stream.fileno())
+        except BaseException:
+            stream.close()
+            partial_path.unlink()
+            raise
+
+    os.replace(partial_path, output_path)
+    return records_count, sha256.hexdigest() if sha256 is not None else None
+
+
+def convert_xml_to_json(
+    input_path: Path,
+    output_path: Path,
+    flatten: bool = False,
+    calculate_checksums: bool = True,
+    cache_entry: Optional[CacheEntry] = None,
+    share_subtrees: bool = False,
+    fsync: bool = False,
+) -> ConversionResult:
     """Convert a HPRA XML file to JSON, optionally flattening the structure.
     
     Args:
@@ -141,6 +613,11 @@ def convert_xml_to_json(input_path: Path, output_path: Path, flatten: bool = Fal
         output_path: Path to output JSON file
         flatten: If True, flatten the JSON structure
         calculate_checksums: If True, calculate SHA-256 hashes for integrity verification
+        cache_entry: Record of the previous conversion to output_path; if it is
+            still current the existing output is kept and parsing is skipped
+        share_subtrees: If True, identical subtrees share one object while
+            converting (see parse_xml)
+        fsync: If True, flush the output to stable storage before returning
     
     Returns:
         ConversionResult with success status, record count, hashes, and any warnings/errors.
@@ -149,40 +626,33 @@ def convert_xml_to_json(input_path: Path, output_path: Path, flatten: bool = Fal
     output_hash = None
     
     try:
-        # Calculate input file hash before processing
-        if calculate_checksums:
+        write_output = _write_flattened if flatten else _write_nested
+
+        if cache_entry is not None:
+            # The input hash decides whether parsing is needed at all
             input_hash = calculate_sha256(input_path)
-        
-        data = parse_xml(input_path)
-        records_count = 0
-        warning = None
-        
-        if flatten:
-            flattened_data = flatten_data(data)
-            if isinstance(flattened_data, list):
-                records_count = len(flattened_data)
-            else:
-                records_count = 1
-            data = flattened_data
+            if cache_entry.is_current(input_hash, output_path, flatten):
+                records_count = cache_entry.records_processed
+                return ConversionResult(
+                    success=True,
+                    records_processed=records_count,
+                    warning_message=None if records_count else _NO_RECORDS_WARNING,
+                    input_sha256=input_hash,
+                    output_sha256=cache_entry.output_sha256,
+                    cached=True
+                )
+            records_count, output_hash = write_output(input_path, output_path, share_subtrees, calculate_checksums, fsync)
+        elif calculate_checksums:
+            # hashlib releases the GIL, so hash the input while it is converted
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                input_hash_future = executor.submit(calculate_sha256, input_path)
+                records_count, output_hash = write_output(input_path, output_path, share_subtrees, calculate_checksums, fsync)
+                input_hash = input_hash_future.result()
         else:
-            # Count records in nested structure
-            products_section = data.get("Products", {})
-            if isinstance(products_section, dict):
-                products = products_section.get("Product", [])
-                if isinstance(products, list):
-                    records_count = len(products)
-                elif products is not None:
-                    records_count = 1
-        
-        output_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-        
-        # Calculate output file hash after writing
-        if calculate_checksums:
-            output_hash = calculate_sha256(output_path)
+            records_count, output_hash = write_output(input_path, output_path, share_subtrees, calculate_checksums, fsync)
         
         # Add warning if no records found
-        if records_count == 0:
-            warning = "No products found in XML file"
+        warning = _NO_RECORDS_WARNING if records_count == 0 else None
         
         return ConversionResult(
             success=True,
@@ -191,7 +661,7 @@ def convert_xml_to_json(input_path: Path, output_path: Path, flatten: bool = Fal
             input_sha256=input_hash,
             output_sha256=output_hash
         )
-    except ET.ParseError as e:
+    except _PARSE_ERRORS as e:
         return ConversionResult(
             success=False,
             error_message=f"XML parse error: {str(e)}"
@@ -9,8 +9,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+# Read size for the pre-3.11 hashing fallback; large reads keep the loop in C.
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class FileChecksum:
     """Checksum information for a file."""
     filename: str
@@ -30,13 +35,21 @@ def calculate_sha256(file_path: Path) -> str:
     Returns:
         Hexadecimal string representation of SHA-256 hash
     """
-    sha256_hash = hashlib.sha256()
-    
     with open(file_path, "rb") as f:
-        # Read file in chunks to handle large files efficiently
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hashing runs in C with the GIL released
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        # Read file in large chunks into a reused buffer
+        sha256_hash = hashlib.sha256()
+        buffer = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            sha256_hash.update(view[:size])
+
     return sha256_hash.hexdigest()
 
 
@@ -102,21 +115,24 @@ def write_checksums_csv(
             'relative_path'
         ]
         
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.writer(csvfile)
         
         # Write header only if file is new or being overwritten
         if not file_exists:
-            writer.writeheader()
+            writer.writerow(fieldnames)
         
-        for checksum in checksums:
-            writer.writerow({
-                'timestamp': checksum.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                'filename': checksum.filename,
-                'file_type': checksum.file_type,
-                'sha256_hash': checksum.sha256_hash,
-                'file_size_bytes': checksum.file_size,
-                'relative_path': checksum.relative_path or checksum.filename
-            })
+        # Rows are tuples in fieldnames order, written in a single C-level call
+        writer.writerows(
+            (
+                checksum.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                checksum.filename,
+                checksum.file_type,
+                checksum.sha256_hash,
+                checksum.file_size,
+                checksum.relative_path or checksum.filename
+            )
+            for checksum in checksums
+        )
 
 
 def verify_file_integrity(file_path: Path, expected_hash: str) -> bool:
@@ -2,22 +2,72 @@
 
 from __future__ import annotations
 
+import functools
+import os
 from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from ._compat import DATACLASS_SLOTS
 
 try:
     from openpyxl import Workbook
-    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
     from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+if OPENPYXL_AVAILABLE:
+    # Styles are shared by every cell that uses them, so build them once
+    _HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    _HEADER_FONT = Font(bold=True, color="FFFFFF")
+    _SUMMARY_HEADER_FONT = Font(bold=True, color="FFFFFF", size=12)
+    _HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+    _TITLE_FONT = Font(bold=True, size=14)
+    _SECTION_FONT = Font(bold=True, size=12)
+    _BOLD_FONT = Font(bold=True)
+    _HEADER_STYLE = "HPRA Report Header"
+    _STATUS_STYLES = {
+        "SUCCESS": (PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"), Font(color="006100")),
+        "FAILURE": (PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"), Font(color="9C0006")),
+        "WARNING": (PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"), Font(color="9C6500")),
+        "SKIPPED": (PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid"), None),
+    }
 
-@dataclass
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+EXCEL_AVAILABLE = XLSXWRITER_AVAILABLE or OPENPYXL_AVAILABLE
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Workbooks are zipped straight into this buffer; the default 8 KiB buffer
+# costs several times more write calls per report
+_SAVE_BUFFER_SIZE = 1 << 20
+
+# Saves submitted by generate_excel_report_async; threads start on first use
+# and pending saves are finished before the interpreter exits
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="report-save")
+
+_result_status = attrgetter("status")
+_result_records = attrgetter("records_processed")
+_result_messages = attrgetter("error_message", "warning_message")
+
+_DETAILS_HEADERS = ("Filename", "Status", "Timestamp", "Records", "Error/Warning Message")
+_ISSUES_HEADERS = ("Issue Description", "Occurrences")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ProcessingResult:
     """Result of processing a single XML file."""
     filename: str
@@ -28,32 +78,68 @@ class ProcessingResult:
     records_processed: int = 0
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class BatchSnapshot:
+    """Immutable totals of a batch at one point in time, shared by the report writers."""
+    start_time: datetime
+    end_time: Optional[datetime]
+    total_files: int
+    total_processed: int
+    total_skipped: int
+    total_warnings: int
+    total_failures: int
+    total_records: int
+    frequent_issues: Tuple[Tuple[str, int], ...]
+
+    @property
+    def success_rate(self) -> float:
+        """Percentage of files that were processed successfully."""
+        return (self.total_processed / self.total_files * 100) if self.total_files > 0 else 0
+
+
 @dataclass
 class BatchMetrics:
-    """Accumulated metrics for a batch processing run."""
+    """Accumulated metrics for a batch processing run.
+
+    Status counts, the record total and issue counts are tallied as results
+    are added, so the report properties do not rescan ``results``.
+    """
     start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
     results: List[ProcessingResult] = field(default_factory=list)
+    _status_counts: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
+    _records_total: int = field(default=0, init=False, repr=False, compare=False)
+    _issue_counter: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
+    _msg_pool: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Tally any results passed to the constructor. map/attrgetter and
+        # Counter.update run in C; each result yields its error before its
+        # warning, the same order add_result uses, so issue ties rank identically
+        results = self.results
+        self._status_counts.update(map(_result_status, results))
+        self._records_total = sum(map(_result_records, results))
+        self._issue_counter.update(filter(None, chain.from_iterable(map(_result_messages, results))))
     
     @property
     def total_processed(self) -> int:
         """Count of successfully processed files."""
-        return sum(1 for r in self.results if r.status == 'success')
+        return self._status_counts['success']
     
     @property
     def total_skipped(self) -> int:
         """Count of skipped files."""
-        return sum(1 for r in self.results if r.status == 'skipped')
+        return self._status_counts['skipped']
     
     @property
     def total_warnings(self) -> int:
         """Count of files with warnings."""
-        return sum(1 for r in self.results if r.status == 'warning')
+        return self._status_counts['warning']
     
     @property
     def total_failures(self) -> int:
         """Count of failed files."""
-        return sum(1 for r in self.results if r.status == 'failure')
+        return self._status_counts['failure']
     
     @property
     def total_files(self) -> int:
@@ -63,234 +149,478 @@ class BatchMetrics:
     @property
     def total_records(self) -> int:
         """Total number of records processed across all files."""
-        return sum(r.records_processed for r in self.results)
+        return self._records_total
     
     def get_frequent_issues(self, top_n: int = 10) -> List[tuple[str, int]]:
-        """Return the most frequent error/warning messages."""
-        issue_counter = Counter()
-        for result in self.results:
-            if result.error_message:
-                issue_counter[result.error_message] += 1
-            if result.warning_message:
-                issue_counter[result.warning_message] += 1
-        return issue_counter.most_common(top_n)
+        """Return the most frequent error/warning messages.
+
+        Messages are counted as results are added, so this only selects the
+        top entries among the distinct messages (a heap of ``top_n``); the
+        cost does not depend on the number of results.
+        """
+        return self._issue_counter.most_common(top_n)
     
     def add_result(self, result: ProcessingResult) -> None:
-        """Add a processing result to the batch."""
+        """Add a processing result to the batch.
+
+        Repeated error and warning messages are replaced with one shared
+        string, since results unpickled from worker processes each carry
+        their own copy.
+        """
+        if result.error_message is not None:
+            result.error_message = self._intern(result.error_message)
+        if result.warning_message is not None:
+            result.warning_message = self._intern(result.warning_message)
+        self._tally(result)
         self.results.append(result)
+
+    def _intern(self, message: str) -> str:
+        """Return the pooled copy of a message."""
+        return self._msg_pool.setdefault(message, message)
+
+    def _tally(self, result: ProcessingResult) -> None:
+        """Update the running counts with one result."""
+        self._status_counts[result.status] += 1
+        self._records_total += result.records_processed
+        if result.error_message:
+            self._issue_counter[result.error_message] += 1
+        if result.warning_message:
+            self._issue_counter[result.warning_message] += 1
+    
+    def snapshot(self, top_n: int = 20) -> BatchSnapshot:
+        """Capture the current totals and most frequent issues.
+
+        The totals come from the running counters, so no results are scanned.
+
+        Args:
+            top_n: Number of most frequent issues to include
+
+        Returns:
+            Immutable snapshot of the batch
+        """
+        return BatchSnapshot(
+            start_time=self.start_time,
+            end_time=self.end_time,
+            total_files=len(self.results),
+            total_processed=self._status_counts['success'],
+            total_skipped=self._status_counts['skipped'],
+            total_warnings=self._status_counts['warning'],
+            total_failures=self._status_counts['failure'],
+            total_records=self._records_total,
+            frequent_issues=tuple(self._issue_counter.most_common(top_n)),
+        )
     
     def finalize(self) -> None:
         """Mark the batch as complete."""
         self.end_time = datetime.now()
 
 
+def _fmt_ts(ts: datetime) -> str:
+    """Format a timestamp for reports, reusing the text for repeated seconds."""
+    # The format has whole-second resolution and no zone, so drop microseconds
+    # and tzinfo before the cache lookup; results from a fast batch mostly
+    # share a handful of seconds. Aware datetimes for one instant in different
+    # zones compare equal, so keeping tzinfo would let them share an entry.
+    return _fmt_second(ts.replace(microsecond=0, tzinfo=None))
+
+
+@functools.lru_cache(maxsize=8192)
+def _fmt_second(ts: datetime) -> str:
+    return ts.strftime(_TIMESTAMP_FORMAT)
+
+
 def generate_excel_report(metrics: BatchMetrics, output_path: Path) -> None:
-    """Generate a human-readable Excel quality summary report."""
+    """Generate a human-readable Excel quality summary report.
+
+    xlsxwriter is used when installed, in constant-memory mode; otherwise
+    openpyxl in write-only mode. Either way rows are streamed to disk, so
+    memory use does not grow with the batch size.
+    """
+    save = _build_workbook(metrics, output_path)
+    save()
+
+
+def generate_excel_report_async(metrics: BatchMetrics, output_path: Path) -> Future:
+    """Generate the Excel report, compressing and saving it on a background thread.
+
+    The workbook is built before this returns, so ``metrics`` may change
+    afterwards; only zipping it into ``output_path`` is deferred. zlib
+    releases the GIL while compressing, so the save overlaps with whatever
+    the caller does next, such as processing the next batch.
+
+    Args:
+        metrics: Metrics of the batch to report on
+        output_path: Path of the workbook to write
+
+    Returns:
+        Future resolving to ``output_path`` once the report is saved, or
+        raising the error that stopped the save
+    """
+    save = _build_workbook(metrics, output_path)
+    return _SAVE_POOL.submit(save)
+
+
+def _build_workbook(metrics: BatchMetrics, output_path: Path) -> Callable[[], Path]:
+    """Build the Excel report and return a function that saves it.
+
+    Building streams the rows to temporary files; the returned function
+    zips them into ``output_path`` and returns that path.
+    """
+    if XLSXWRITER_AVAILABLE:
+        return _build_workbook_streaming(metrics, output_path)
+
     if not OPENPYXL_AVAILABLE:
         raise ImportError(
-            "openpyxl is required to generate Excel reports. "
+            "openpyxl or xlsxwriter is required to generate Excel reports. "
             "Install it with: pip install openpyxl"
         )
     
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
-    
-    # Summary Sheet
-    summary_sheet = wb.create_sheet("Summary")
-    _populate_summary_sheet(summary_sheet, metrics)
-    
-    # Detailed Results Sheet
-    details_sheet = wb.create_sheet("Detailed Results")
-    _populate_details_sheet(details_sheet, metrics)
-    
-    # Issues Sheet
-    issues_sheet = wb.create_sheet("Frequent Issues")
-    _populate_issues_sheet(issues_sheet, metrics)
-    
-    # Save the workbook
-    wb.save(output_path)
+    # Write-only workbooks stream rows out instead of keeping a Cell object for
+    # every value; styles are attached to WriteOnlyCells as rows are appended.
+    wb = Workbook(write_only=True)
+    # Table headers share one named style, assigned to each cell by name
+    wb.add_named_style(
+        NamedStyle(name=_HEADER_STYLE, font=_HEADER_FONT, fill=_HEADER_FILL, alignment=_HEADER_ALIGNMENT)
+    )
+    summary = metrics.snapshot(top_n=20)
+    _populate_summary_sheet(wb.create_sheet("Summary"), summary)
+    _populate_details_sheet(wb.create_sheet("Detailed Results"), metrics)
+    _populate_issues_sheet(wb.create_sheet("Frequent Issues"), summary)
+
+    def save() -> Path:
+        with open(output_path, "wb", buffering=_SAVE_BUFFER_SIZE) as handle:
+            wb.save(handle)
+        return output_path
+
+    return save
+
 
+def _styled_cell(ws, value, font=None, fill=None):
+    """Return a write-only cell carrying the given styles."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    return cell
 
-def _populate_summary_sheet(ws, metrics: BatchMetrics) -> None:
+
+def _header_row(ws, headers: Tuple[str, ...]) -> List:
+    """Return styled header cells for a write-only sheet.
+
+    The cells are built already styled, so the header row is written once
+    with no second pass over its cells.
+    """
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.style = _HEADER_STYLE
+        cells.append(cell)
+    return cells
+
+
+def _populate_summary_sheet(ws, summary: BatchSnapshot) -> None:
     """Populate the Summary sheet with key metrics."""
-    # Header styling
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF", size=12)
-    
-    # Title
-    ws.append(["HPRA Parser - Quality Summary Report"])
-    ws["A1"].font = Font(bold=True, size=14)
-    ws.append([])
-    
-    # Batch Information
-    ws.append(["Batch Information"])
-    ws["A3"].font = Font(bold=True, size=12)
-    ws.append(["Start Time", metrics.start_time.strftime("%Y-%m-%d %H:%M:%S")])
-    ws.append(["End Time", metrics.end_time.strftime("%Y-%m-%d %H:%M:%S") if metrics.end_time else "In Progress"])
-    duration = (metrics.end_time - metrics.start_time).total_seconds() if metrics.end_time else 0
-    ws.append(["Duration (seconds)", f"{duration:.2f}"])
-    ws.append([])
-    
-    # Processing Counts
-    ws.append(["Processing Counts"])
-    ws["A8"].font = Font(bold=True, size=12)
-    ws.append(["Metric", "Count"])
-    ws["A9"].fill = header_fill
-    ws["A9"].font = header_font
-    ws["B9"].fill = header_fill
-    ws["B9"].font = header_font
-    
-    ws.append(["Total Files", metrics.total_files])
-    ws.append(["Successfully Processed", metrics.total_processed])
-    ws.append(["Skipped", metrics.total_skipped])
-    ws.append(["Warnings", metrics.total_warnings])
-    ws.append(["Failures", metrics.total_failures])
-    ws.append(["Total Records Processed", metrics.total_records])
-    ws.append([])
-    
-    # Success Rate
-    success_rate = (metrics.total_processed / metrics.total_files * 100) if metrics.total_files > 0 else 0
-    ws.append(["Success Rate", f"{success_rate:.2f}%"])
-    ws["A16"].font = Font(bold=True)
-    
-    # Column widths
+    duration = (summary.end_time - summary.start_time).total_seconds() if summary.end_time else 0
+
+    # The sheet has a fixed shape, so build every row up front with its
+    # styles attached rather than styling cells by coordinate afterwards.
+    rows = [
+        [_styled_cell(ws, "HPRA Parser - Quality Summary Report", _TITLE_FONT)],
+        [],
+        # Batch Information
+        [_styled_cell(ws, "Batch Information", _SECTION_FONT)],
+        ["Start Time", _fmt_ts(summary.start_time)],
+        ["End Time", _fmt_ts(summary.end_time) if summary.end_time else "In Progress"],
+        ["Duration (seconds)", f"{duration:.2f}"],
+        [],
+        # Processing Counts
+        [_styled_cell(ws, "Processing Counts", _SECTION_FONT)],
+        [
+            _styled_cell(ws, "Metric", _SUMMARY_HEADER_FONT, _HEADER_FILL),
+            _styled_cell(ws, "Count", _SUMMARY_HEADER_FONT, _HEADER_FILL),
+        ],
+        ["Total Files", summary.total_files],
+        ["Successfully Processed", summary.total_processed],
+        ["Skipped", summary.total_skipped],
+        ["Warnings", summary.total_warnings],
+        ["Failures", summary.total_failures],
+        ["Total Records Processed", summary.total_records],
+        [],
+        # Success Rate
+        [_styled_cell(ws, "Success Rate", _BOLD_FONT), f"{summary.success_rate:.2f}%"],
+    ]
+
+    # Column widths must be set before the first row is streamed
     ws.column_dimensions["A"].width = 30
     ws.column_dimensions["B"].width = 20
+    for row in rows:
+        ws.append(row)
 
 
 def _populate_details_sheet(ws, metrics: BatchMetrics) -> None:
     """Populate the Detailed Results sheet with per-file information."""
-    # Header styling
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-    
-    # Headers
-    headers = ["Filename", "Status", "Timestamp", "Records", "Error/Warning Message"]
-    ws.append(headers)
-    
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_num)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-    
-    # Data rows
-    for result in metrics.results:
-        message = result.error_message or result.warning_message or ""
-        ws.append([
-            result.filename,
-            result.status.upper(),
-            result.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-            result.records_processed,
-            message
-        ])
-    
-    # Apply conditional formatting for status
-    for row_num in range(2, len(metrics.results) + 2):
-        status_cell = ws.cell(row=row_num, column=2)
-        status_value = status_cell.value
-        
-        if status_value == "SUCCESS":
-            status_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-            status_cell.font = Font(color="006100")
-        elif status_value == "FAILURE":
-            status_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-            status_cell.font = Font(color="9C0006")
-        elif status_value == "WARNING":
-            status_cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-            status_cell.font = Font(color="9C6500")
-        elif status_value == "SKIPPED":
-            status_cell.fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-    
-    # Column widths
+    # Column widths and the frozen header must be set before streaming rows
     ws.column_dimensions["A"].width = 30
     ws.column_dimensions["B"].width = 15
     ws.column_dimensions["C"].width = 20
     ws.column_dimensions["D"].width = 10
     ws.column_dimensions["E"].width = 60
-    
-    # Freeze header row
+    # openpyxl turns even a Cell into a coordinate string here, and it is
+    # parsed once per sheet; the xlsxwriter writer freezes by (row, column)
     ws.freeze_panes = "A2"
 
+    ws.append(_header_row(ws, _DETAILS_HEADERS))
+    
+    # Data rows, with the status cell styled as it is written
+    for result in metrics.results:
+        status = result.status.upper()
+        style = _STATUS_STYLES.get(status)
+        if style:
+            fill, font = style
+            status = _styled_cell(ws, status, font, fill)
+        ws.append([
+            result.filename,
+            status,
+            _fmt_ts(result.timestamp),
+            result.records_processed,
+            result.error_message or result.warning_message,
+        ])
+
 
-def _populate_issues_sheet(ws, metrics: BatchMetrics) -> None:
+def _populate_issues_sheet(ws, summary: BatchSnapshot) -> None:
     """Populate the Frequent Issues sheet."""
-    # Header styling
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-    
+    ws.column_dimensions["A"].width = 80
+    ws.column_dimensions["B"].width = 15
+    ws.freeze_panes = "A4"
+
     # Title
-    ws.append(["Most Frequent Issues"])
-    ws["A1"].font = Font(bold=True, size=12)
+    ws.append([_styled_cell(ws, "Most Frequent Issues", _SECTION_FONT)])
     ws.append([])
-    
-    # Headers
-    headers = ["Issue Description", "Occurrences"]
-    ws.append(headers)
-    
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=3, column=col_num)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    ws.append(_header_row(ws, _ISSUES_HEADERS))
     
     # Data rows
-    frequent_issues = metrics.get_frequent_issues(top_n=20)
+    frequent_issues = summary.frequent_issues
     
     if not frequent_issues:
         ws.append(["No issues recorded", "0"])
     else:
         for issue, count in frequent_issues:
             ws.append([issue, count])
-    
-    # Column widths
-    ws.column_dimensions["A"].width = 80
-    ws.column_dimensions["B"].width = 15
-    
-    # Freeze header row
-    ws.freeze_panes = "A4"
 
 
-def generate_text_report(metrics: BatchMetrics) -> str:
-    """Generate a plain text summary report (fallback if Excel is unavailable)."""
-    lines = [
-        "=" * 70,
-        "HPRA Parser - Quality Summary Report",
-        "=" * 70,
-        "",
-        "Batch Information:",
-        f"  Start Time: {metrics.start_time.strftime('%Y-%m-%d %H:%M:%S')}",
-        f"  End Time: {metrics.end_time.strftime('%Y-%m-%d %H:%M:%S') if metrics.end_time else 'In Progress'}",
-    ]
-    
-    if metrics.end_time:
-        duration = (metrics.end_time - metrics.start_time).total_seconds()
-        lines.append(f"  Duration: {duration:.2f} seconds")
-    
-    lines.extend([
-        "",
-        "Processing Counts:",
-        f"  Total Files: {metrics.total_files}",
-        f"  Successfully Processed: {metrics.total_processed}",
-        f"  Skipped: {metrics.total_skipped}",
-        f"  Warnings: {metrics.total_warnings}",
-        f"  Failures: {metrics.total_failures}",
-        f"  Total Records: {metrics.total_records}",
-        "",
-    ])
-    
-    success_rate = (metrics.total_processed / metrics.total_files * 100) if metrics.total_files > 0 else 0
-    lines.append(f"Success Rate: {success_rate:.2f}%")
-    lines.append("")
-    
-    frequent_issues = metrics.get_frequent_issues(top_n=10)
-    if frequent_issues:
-        lines.extend([
-            "Most Frequent Issues:",
-            ""
-        ])
-        for issue, count in frequent_issues:
-            lines.append(f"  [{count}x] {issue}")
-    
-    lines.append("=" * 70)
-    return "\n".join(lines)
+# xlsxwriter format properties, mirroring the openpyxl styles above
+_XLSX_FORMATS = {
+    "title": {"bold": True, "font_size": 14},
+    "section": {"bold": True, "font_size": 12},
+    "bold": {"bold": True},
+    "summary_header": {"bold": True, "font_color": "#FFFFFF", "font_size": 12, "bg_color": "#366092", "pattern": 1},
+    "header": {
+        "bold": True, "font_color": "#FFFFFF", "bg_color": "#366092", "pattern": 1,
+        "align": "center", "valign": "vcenter",
+    },
+    "SUCCESS": {"bg_color": "#C6EFCE", "pattern": 1, "font_color": "#006100"},
+    "FAILURE": {"bg_color": "#FFC7CE", "pattern": 1, "font_color": "#9C0006"},
+    "WARNING": {"bg_color": "#FFEB9C", "pattern": 1, "font_color": "#9C6500"},
+    "SKIPPED": {"bg_color": "#E7E6E6", "pattern": 1},
+}
+
+
+def _build_workbook_streaming(metrics: BatchMetrics, output_path: Path) -> Callable[[], Path]:
+    """Build the Excel report with xlsxwriter in constant-memory mode.
+
+    Each row is flushed to a temporary file once the next row is started,
+    so every sheet is written strictly top to bottom. The returned function
+    closes the workbook, which zips it into ``output_path``; xlsxwriter only
+    opens that file then, so a failed build leaves an existing report intact.
+    """
+    wb = xlsxwriter.Workbook(str(output_path), {"constant_memory": True})
+    # Each format is added once and shared by every cell and sheet using it
+    formats = {name: wb.add_format(properties) for name, properties in _XLSX_FORMATS.items()}
+    summary = metrics.snapshot(top_n=20)
+    try:
+        _write_summary_sheet(wb.add_worksheet("Summary"), formats, summary)
+        _write_details_sheet(wb.add_worksheet("Detailed Results"), formats, metrics)
+        _write_issues_sheet(wb.add_worksheet("Frequent Issues"), formats, summary)
+    except BaseException:
+        # The workbook will never be closed, so remove the temporary row
+        # files xlsxwriter keeps open for each constant-memory worksheet
+        for ws in wb.worksheets():
+            if ws.row_data_fh is not None:
+                ws.row_data_fh.close()
+                try:
+                    os.remove(ws.row_data_filename)
+                except OSError:
+                    pass
+        raise
+
+    def save() -> Path:
+        wb.close()
+        return output_path
+
+    return save
+
+
+def _write_summary_sheet(ws, formats: Dict[str, Any], summary: BatchSnapshot) -> None:
+    """Write the Summary sheet with key metrics."""
+    ws.set_column(0, 0, 30)
+    ws.set_column(1, 1, 20)
+
+    ws.write_string(0, 0, "HPRA Parser - Quality Summary Report", formats["title"])
+
+    # Batch Information
+    ws.write_string(2, 0, "Batch Information", formats["section"])
+    ws.write_row(3, 0, ("Start Time", _fmt_ts(summary.start_time)))
+    ws.write_row(4, 0, ("End Time", _fmt_ts(summary.end_time) if summary.end_time else "In Progress"))
+    duration = (summary.end_time - summary.start_time).total_seconds() if summary.end_time else 0
+    ws.write_row(5, 0, ("Duration (seconds)", f"{duration:.2f}"))
+
+    # Processing Counts
+    ws.write_string(7, 0, "Processing Counts", formats["section"])
+    ws.write_row(8, 0, ("Metric", "Count"), formats["summary_header"])
+    ws.write_row(9, 0, ("Total Files", summary.total_files))
+    ws.write_row(10, 0, ("Successfully Processed", summary.total_processed))
+    ws.write_row(11, 0, ("Skipped", summary.total_skipped))
+    ws.write_row(12, 0, ("Warnings", summary.total_warnings))
+    ws.write_row(13, 0, ("Failures", summary.total_failures))
+    ws.write_row(14, 0, ("Total Records Processed", summary.total_records))
+
+    # Success Rate
+    ws.write_string(16, 0, "Success Rate", formats["bold"])
+    ws.write_string(16, 1, f"{summary.success_rate:.2f}%")
+
+
+def _write_details_sheet(ws, formats: Dict[str, Any], metrics: BatchMetrics) -> None:
+    """Write the Detailed Results sheet with per-file information."""
+    ws.set_column(0, 0, 30)
+    ws.set_column(1, 1, 15)
+    ws.set_column(2, 2, 20)
+    ws.set_column(3, 3, 10)
+    ws.set_column(4, 4, 60)
+    ws.freeze_panes(1, 0)
+
+    ws.write_row(0, 0, _DETAILS_HEADERS, formats["header"])
+
+    # Strings are written explicitly so filenames and messages are never
+    # interpreted as formulas or URLs.
+    write_string = ws.write_string
+    status_format = formats.get
+    for row, result in enumerate(metrics.results, 1):
+        status = result.status.upper()
+        write_string(row, 0, result.filename)
+        write_string(row, 1, status, status_format(status))
+        write_string(row, 2, _fmt_ts(result.timestamp))
+        ws.write_number(row, 3, result.records_processed)
+        message = result.error_message or result.warning_message
+        if message:
+            write_string(row, 4, message)
+
+
+def _write_issues_sheet(ws, formats: Dict[str, Any], summary: BatchSnapshot) -> None:
+    """Write the Frequent Issues sheet."""
+    ws.set_column(0, 0, 80)
+    ws.set_column(1, 1, 15)
+    ws.freeze_panes(3, 0)
+
+    ws.write_string(0, 0, "Most Frequent Issues", formats["section"])
+    ws.write_row(2, 0, _ISSUES_HEADERS, formats["header"])
+
+    frequent_issues = summary.frequent_issues
+    if not frequent_issues:
+        ws.write_row(3, 0, ("No issues recorded", "0"))
+    for row, (issue, count) in enumerate(frequent_issues, 3):
+        ws.write_string(row, 0, issue)
+        ws.write_number(row, 1, count)
+
+
+def generate_text_report(metrics: Union[BatchMetrics, BatchSnapshot]) -> str:
+    """Generate a plain text summary report (fallback if Excel is unavailable).
+
+    Accepts the batch metrics or a snapshot previously taken from them.
+    """
+    summary = metrics.snapshot(top_n=10) if isinstance(metrics, BatchMetrics) else metrics
+    rule = "=" * 70
+    end_time = _fmt_ts(summary.end_time) if summary.end_time else "In Progress"
+    duration = (
+        f"  Duration: {(summary.end_time - summary.start_time).total_seconds():.2f} seconds\n"
+        if summary.end_time else ""
+    )
+
+    frequent_issues = summary.frequent_issues
+    issues = (
+        "Most Frequent Issues:\n\n" + "".join(f"  [{count}x] {issue}\n" for issue, count in frequent_issues)
+        if frequent_issues else ""
+    )
+
+    return (
+        f"{rule}\n"
+        "HPRA Parser - Quality Summary Report\n"
+        f"{rule}\n"
+        "\n"
+        "Batch Information:\n"
+        f"  Start Time: {_fmt_ts(summary.start_time)}\n"
+        f"  End Time: {end_time}\n"
+        f"{duration}"
+        "\n"
+        "Processing Counts:\n"
+        f"  Total Files: {summary.total_files}\n"
+        f"  Successfully Processed: {summary.total_processed}\n"
+        f"  Skipped: {summary.total_skipped}\n"
+        f"  Warnings: {summary.total_warnings}\n"
+        f"  Failures: {summary.total_failures}\n"
+        f"  Total Records: {summary.total_records}\n"
+        "\n"
+        f"Success Rate: {summary.success_rate:.2f}%\n"
+        "\n"
+        f"{issues}"
+        f"{rule}"
+    )
+
+
+def _excel_report(metrics: BatchMetrics, output_path: Path) -> Path:
+    """Write the quality report as an Excel workbook and return its path."""
+    generate_excel_report(metrics, output_path)
+    return output_path
+
+
+def _text_report(metrics: BatchMetrics, output_path: Path) -> Path:
+    """Write the quality report as text next to ``output_path`` and return its path."""
+    text_path = Path(output_path).with_suffix(".txt")
+    text_path.write_text(generate_text_report(metrics), encoding="utf-8")
+    return text_path
+
+
+# Write the quality report in the best format available: Excel when openpyxl
+# or xlsxwriter is installed, otherwise text with a ``.txt`` suffix. The
+# writer is chosen once at import and returns the path it wrote.
+generate_report = _excel_report if EXCEL_AVAILABLE else _text_report
+
+
+def _run_one(job: Tuple[BatchMetrics, Path]) -> Path:
+    """Write the report for one batch (module-level so worker processes can unpickle it)."""
+    metrics, output_path = job
+    return generate_report(metrics, output_path)
+
+
+def generate_reports(
+    jobs: Iterable[Tuple[BatchMetrics, Path]],
+    max_workers: Optional[int] = None,
+) -> List[Path]:
+    """Write quality reports for several independent batches in parallel.
+
+    Report generation is CPU-bound pure Python, so batches are spread over
+    worker processes rather than threads.
+
+    Args:
+        jobs: Pairs of batch metrics and the report path to write for them
+        max_workers: Number of worker processes (defaults to the number of CPUs)
+
+    Returns:
+        Paths of the reports written, in the same order as ``jobs``
+    """
+    jobs = list(jobs)
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [_run_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_run_one, jobs))
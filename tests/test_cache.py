@@ -0,0 +1,64 @@
+"""Tests for the conversion cache."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from hpra_parser.cache import CACHE_FILENAME, OUTPUT_FORMAT_VERSION, CacheEntry, ConversionCache
+from hpra_parser.integrity import calculate_sha256
+
+
+class CacheFormatVersionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.output_path = self.tmp / "products.json"
+        self.output_path.write_text("[]", encoding="utf-8")
+        self.output_sha256 = calculate_sha256(self.output_path)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def entry(self, format_version: int) -> CacheEntry:
+        return CacheEntry(
+            input_sha256="input",
+            output_sha256=self.output_sha256,
+            flatten=True,
+            records_processed=0,
+            format_version=format_version,
+        )
+
+    def test_current_format_is_reused(self) -> None:
+        self.assertTrue(self.entry(OUTPUT_FORMAT_VERSION).is_current("input", self.output_path, True))
+
+    def test_older_format_is_stale(self) -> None:
+        entry = self.entry(OUTPUT_FORMAT_VERSION - 1)
+        self.assertFalse(entry.is_current("input", self.output_path, True))
+
+    def test_entry_without_version_is_stale(self) -> None:
+        legacy = {
+            self.output_path.name: {
+                "input_sha256": "input",
+                "output_sha256": self.output_sha256,
+                "flatten": True,
+                "records_processed": 0,
+            }
+        }
+        (self.tmp / CACHE_FILENAME).write_text(json.dumps(legacy), encoding="utf-8")
+
+        entry = ConversionCache.load(self.tmp).get(self.output_path)
+        self.assertIsNotNone(entry)
+        self.assertFalse(entry.is_current("input", self.output_path, True))
+
+    def test_version_round_trips(self) -> None:
+        cache = ConversionCache(self.tmp)
+        cache.put(self.output_path, self.entry(OUTPUT_FORMAT_VERSION))
+        cache.save()
+
+        entry = ConversionCache.load(self.tmp).get(self.output_path)
+        self.assertEqual(entry, self.entry(OUTPUT_FORMAT_VERSION))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Regression tests for the HPRA XML converter."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from hpra_parser import converter
+from hpra_parser.converter import convert_xml_to_json, flatten_data, parse_xml, write_json
+
+
+class ConverterTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def write(self, name: str, content: str) -> Path:
+        path = self.tmp / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def parsers(self):
+        """Yield once per available XML parser (lxml and the standard library)."""
+        modes = [False, True] if converter.LXML_AVAILABLE else [False]
+        for use_lxml in modes:
+            with self.subTest(lxml=use_lxml), mock.patch.object(converter, "LXML_AVAILABLE", use_lxml):
+                yield
+
+
+class ExternalEntityTests(ConverterTestCase):
+    def test_external_entity_is_rejected(self) -> None:
+        secret = self.write("secret.txt", "TOP SECRET")
+        xml_path = self.write(
+            "xxe.xml",
+            '<?xml version="1.0"?>\n'
+            f'<!DOCTYPE Products [<!ENTITY x SYSTEM "{secret.as_uri()}">]>\n'
+            "<Products><Product><a>&x;</a></Product></Products>\n",
+        )
+        for _ in self.parsers():
+            with self.assertRaises(converter._PARSE_ERRORS):
+                parse_xml(xml_path)
+
+            output_path = self.tmp / "xxe.json"
+            result = convert_xml_to_json(xml_path, output_path, calculate_checksums=False)
+            self.assertFalse(result.success)
+            self.assertFalse(output_path.exists())
+
+    @unittest.skipUnless(converter.LXML_AVAILABLE, "lxml 5.0 or newer is required for schema validation")
+    def test_external_entity_is_rejected_by_validation(self) -> None:
+        secret = self.write("secret.txt", "TOP SECRET")
+        xml_path = self.write(
+            "xxe.xml",
+            '<?xml version="1.0"?>\n'
+            f'<!DOCTYPE Products [<!ENTITY x SYSTEM "{secret.as_uri()}">]>\n'
+            "<Products>&x;</Products>\n",
+        )
+        schema_path = self.write(
+            "schema.xsd",
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            '<xs:element name="Products" type="xs:string"/>'
+            "</xs:schema>",
+        )
+        with self.assertRaises(converter.etree.XMLSyntaxError):
+            converter.validate_xml(xml_path, schema_path)
+
+    def test_internal_entity_is_expanded(self) -> None:
+        xml_path = self.write(
+            "internal.xml",
+            '<?xml version="1.0"?>\n'
+            '<!DOCTYPE Products [<!ENTITY x "inner">]>\n'
+            "<Products><Product><a>&x;</a></Product></Products>\n",
+        )
+        for _ in self.parsers():
+            self.assertEqual(parse_xml(xml_path), {"Products": {"Product": {"a": "inner"}}})
+
+    def test_dtd_attribute_default_is_applied(self) -> None:
+        xml_path = self.write(
+            "defaults.xml",
+            '<?xml version="1.0"?>\n'
+            '<!DOCTYPE Products [<!ATTLIST Product kind CDATA "human">]>\n'
+            "<Products><Product><a>1</a></Product></Products>\n",
+        )
+        for _ in self.parsers():
+            self.assertEqual(
+                parse_xml(xml_path),
+                {"Products": {"Product": {"attributes": {"kind": "human"}, "a": "1"}}},
+            )
+
+
+class SchemaValidationTests(ConverterTestCase):
+    def test_missing_lxml_names_required_version(self) -> None:
+        xml_path = self.write("products.xml", "<Products/>")
+        with mock.patch.object(converter, "LXML_AVAILABLE", False):
+            with self.assertRaisesRegex(ImportError, r'pip install "lxml>=5\.0"'):
+                converter.validate_xml(xml_path, self.tmp / "schema.xsd")
+
+
+class FlattenStreamingTests(ConverterTestCase):
+    def assert_matches_flatten_data(self, xml_path: Path, records: int) -> None:
+        expected_path = self.tmp / "expected.json"
+        write_json(flatten_data(parse_xml(xml_path)), expected_path)
+        output_path = self.tmp / "streamed.json"
+        result = convert_xml_to_json(xml_path, output_path, flatten=True, calculate_checksums=False)
+        self.assertTrue(result.success)
+        self.assertEqual(result.records_processed, records)
+        self.assertEqual(output_path.read_bytes(), expected_path.read_bytes())
+
+    def test_sole_list_valued_product_is_expanded(self) -> None:
+        xml_path = self.write(
+            "nested.xml",
+            "<Products><Product><Product><a>1</a></Product><Product><a>2</a></Product></Product></Products>",
+        )
+        for _ in self.parsers():
+            self.assert_matches_flatten_data(xml_path, records=2)
+
+    def test_list_valued_product_among_siblings_is_one_record(self) -> None:
+        xml_path = self.write(
+            "siblings.xml",
+            '<Products Date="2024-01-01">'
+            "<Product><Product><a>1</a></Product><Product><a>2</a></Product></Product>"
+            "<Product><b>3</b></Product>"
+            "</Products>",
+        )
+        for _ in self.parsers():
+            self.assert_matches_flatten_data(xml_path, records=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
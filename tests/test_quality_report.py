@@ -0,0 +1,49 @@
+"""Tests for the quality report writers."""
+
+import gc
+import tempfile
+import unittest
+import warnings
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+from hpra_parser import quality_report
+from hpra_parser.quality_report import BatchMetrics, generate_excel_report
+
+
+class ExcelReportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    @unittest.skipUnless(quality_report.XLSXWRITER_AVAILABLE, "xlsxwriter is not installed")
+    def test_failed_build_keeps_existing_report(self) -> None:
+        output_path = self.tmp / "report.xlsx"
+        output_path.write_bytes(b"previous report")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            with mock.patch.object(quality_report, "_write_details_sheet", side_effect=RuntimeError("boom")):
+                with self.assertRaises(RuntimeError):
+                    generate_excel_report(BatchMetrics(), output_path)
+            # Unclosed temporary files are only reported once collected
+            gc.collect()
+
+        self.assertEqual(output_path.read_bytes(), b"previous report")
+        self.assertEqual([w for w in caught if issubclass(w.category, ResourceWarning)], [])
+
+
+class TimestampFormatTests(unittest.TestCase):
+    def test_same_instant_in_other_zone_keeps_its_wall_time(self) -> None:
+        utc = datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+        plus_one = datetime(2025, 1, 1, 11, 0, tzinfo=timezone(timedelta(hours=1)))
+        self.assertEqual(quality_report._fmt_ts(utc), "2025-01-01 10:00:00")
+        self.assertEqual(quality_report._fmt_ts(plus_one), "2025-01-01 11:00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()